@@ -5,37 +5,42 @@ Code Snippet Translator CLI
 Translate code snippets between Python, JavaScript, and Java
 """
 
-import click
-
-from translators import translate_snippet
-
-
-@click.command()
-@click.option(
-    "--from-lang",
-    type=click.Choice(["py", "js", "java"]),
-    default="py",
-    help="Source language",
-)
-@click.option(
-    "--to-lang",
-    type=click.Choice(["py", "js", "java"]),
-    default="js",
-    help="Target language",
-)
-@click.argument("path", type=click.Path(exists=True))
-def cli(from_lang, to_lang, path):
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+LANGUAGES = ["py", "js", "java"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Translate a code snippet from PATH"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--from-lang", choices=LANGUAGES, default="py", help="Source language"
+    )
+    parser.add_argument(
+        "--to-lang", choices=LANGUAGES, default="js", help="Target language"
+    )
+    parser.add_argument("path")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.path):
+        parser.error(f"path '{args.path}' does not exist")
+
+    # Imported after argument parsing so --help and usage errors stay fast
+    from translators import translate_snippet
+
     try:
-        with open(path, "r") as f:
+        with open(args.path, "r") as f:
             src = f.read()
 
-        out = translate_snippet(src, from_lang, to_lang)
+        out = translate_snippet(src, args.from_lang, args.to_lang)
         print(out)
     except Exception as e:
-        click.echo(f"Error: {e}", err=True)
+        print(f"Error: {e}", file=sys.stderr)
         return 1
+    return 0
 
 
 if __name__ == "__main__":
-    cli()
+    sys.exit(main())
@@ -77,5 +77,199 @@ def test_if_statement():
     assert "else" in js_code
 
 
+def test_class_methods():
+    """Test methods and expression statements inside a Python class"""
+    py_code = """class Greeter:
+    \"\"\"Says hello\"\"\"
+    def greet(self, name):
+        print(name)
+        return name"""
+
+    js_code = translate_snippet(py_code, "py", "js")
+    assert js_code.startswith("class Greeter {\n  function greet(self, name) {")
+    assert "return name;" in js_code
+    assert "print" not in js_code
+
+
+def test_constant_folding():
+    """Test numeric literal operations are folded at IR build time"""
+    py_code = """def calc(a):
+    return a + 2 * 3 - 1.0 / 4.0"""
+
+    js_code = translate_snippet(py_code, "py", "js")
+    assert "return a + 6 - 0.25;" in js_code
+
+    # Int division truncates in Java but not in Python/JS, so it stays unfolded
+    py_code = """def calc():
+    return 7 / 2"""
+
+    java_code = translate_snippet(py_code, "py", "java")
+    assert "return 7 / 2;" in java_code
+
+
+def test_same_language_passthrough():
+    """Test same-language translation returns the source unless normalizing"""
+    py_code = """def add(a, b):
+    return (a + b)"""
+
+    assert translate_snippet(py_code, "py", "py") == py_code
+    assert translate_snippet(py_code, "py", "py", normalize=True) == (
+        "def add(a, b):\n    return a + b"
+    )
+
+    with pytest.raises(ValueError):
+        translate_snippet(py_code, "rb", "rb")
+
+
+def test_parse_cache():
+    """Test that callers get fresh IR while translation reuses cached IR"""
+    from translators import _parse
+    from translators.python_parser import parse_python_to_ir
+
+    first = parse_python_to_ir("def f():\n    x = 1")
+    first["body"][0]["name"] = "hacked"
+
+    assert parse_python_to_ir("def f():\n    x = 1")["body"][0]["name"] == "f"
+    assert _parse("x = 1", "py") is _parse("x = 1", "py")
+
+    # Literal nodes shared across trees cannot be changed in place
+    ir = parse_python_to_ir("x = None")
+    with pytest.raises(TypeError):
+        ir["body"][0]["value"]["value"] = 0
+    js_code = translate_snippet("def g():\n    return None", "py", "js")
+    assert "return null;" in js_code
+
+
+def test_parse_many():
+    """Test batch parsing returns the same IR as parsing one at a time"""
+    from translators.batch import parse_many
+    from translators.python_parser import parse_python_to_ir
+
+    sources = ["x = 1", "def f(a):\n    return a * 2", "y = x + 1"]
+
+    assert parse_many(sources, "py", max_workers=2) == [
+        parse_python_to_ir(src) for src in sources
+    ]
+    with pytest.raises(ValueError):
+        parse_many(sources, "rb")
+
+    # A cache lock held by another thread at fork time must not hang workers
+    from translators import _parse_cache
+
+    with _parse_cache._lock:
+        assert parse_many(["z = 3"], "py", max_workers=1) == [
+            parse_python_to_ir("z = 3")
+        ]
+
+
+def test_python_default_values():
+    """Test parameter defaults are translated like any other expression"""
+    py_code = """def greet(name="world", punctuation=None):
+    return name"""
+
+    js_code = translate_snippet(py_code, "py", "js")
+
+    assert 'function greet(name = "world", punctuation = null)' in js_code
+
+    # Partly unsupported defaults keep their source text
+    for default in ("-1 + 2", "g(-1)"):
+        py_code = f"def f(a={default}):\n    return a"
+        js_code = translate_snippet(py_code, "py", "js")
+        assert f"function f(a = {default})" in js_code
+
+    # Operators and chained comparisons the IR lacks keep their source text
+    py_code = "def f(p=2**8, q=10 % 3, n=10 // 3, r=0 < 1 < 2):\n    return p"
+    js_code = translate_snippet(py_code, "py", "js")
+    assert "function f(p = 2 ** 8, q = 10 % 3, n = 10 // 3, r = 0 < 1 < 2)" in js_code
+
+    # String defaults are escaped for the target language
+    py_code = """def f(t='a\\nb', s='say "hi"', u='c:\\\\x'):\n    return t"""
+    js_code = translate_snippet(py_code, "py", "js")
+    assert r'function f(t = "a\nb", s = "say \"hi\"", u = "c:\\x")' in js_code
+
+
+def test_source_text_default_values():
+    """Test IR holding defaults as source text still generates"""
+    from translators.gen_js import generate_js_from_ir
+    from translators.gen_py import generate_py_from_ir
+    from translators.ir import IRBuilder
+
+    params = [IRBuilder.param("a"), IRBuilder.param("b", "5")]
+    ir = IRBuilder.module([IRBuilder.function("f", params, [])])
+
+    assert "def f(a, b=5):" in generate_py_from_ir(ir)
+    assert "function f(a, b = 5)" in generate_js_from_ir(ir)
+
+
+def test_javascript_default_values():
+    """Test JS parameter defaults keep their meaning or stay visible"""
+    js_code = """function f(flag = true, s = "x", n = null, k = -1, z = x * y, o = {}) {
+  return flag;
+}"""
+
+    py_code = translate_snippet(js_code, "js", "py")
+
+    assert 'def f(flag=True, s="x", n=None, k=-1, z=x * y, o=undefined):' in py_code
+
+
+def test_java_unsupported_expression():
+    """Test unsupported Java expressions translate to the None literal"""
+    java_code = """public class C {
+    public static Object make() {
+        return new Object();
+    }
+}"""
+
+    py_code = translate_snippet(java_code, "java", "py")
+
+    assert "return None" in py_code
+    assert "ClassCreator" not in py_code
+
+
+def test_ir_serialization_round_trip():
+    """Test serialized IR reads back unchanged, including edge-case numbers"""
+    from translators.ir import IRBuilder, deserialize_ir, serialize_ir
+
+    ir = IRBuilder.module(
+        [
+            IRBuilder.assign(IRBuilder.name("big"), IRBuilder.literal(2**70)),
+            IRBuilder.assign(IRBuilder.name("inf"), IRBuilder.literal(float("inf"))),
+            IRBuilder.assign(IRBuilder.name("s"), IRBuilder.literal("héllo")),
+        ]
+    )
+
+    assert deserialize_ir(serialize_ir(ir)) == ir
+
+
+def test_javascript_sequential_parses():
+    """Test one JS worker serves several parses in a row"""
+    from translators.js_parser import JSToIR
+
+    for i in range(3):
+        ir = JSToIR(f"let x{i} = {i};").parse()
+        assert ir["body"][0]["target"]["id"] == f"x{i}"
+
+
+def test_javascript_worker_restart(tmp_path, monkeypatch):
+    """Test a JS worker that dies reports its stderr and is replaced"""
+    from translators import js_parser
+
+    # Closes stdout first and exits a little later, like a crashing worker
+    script = tmp_path / "crash.js"
+    script.write_text(
+        "process.stderr.write('worker crashed');"
+        "require('fs').closeSync(1);"
+        "setTimeout(() => process.exit(1), 200);"
+    )
+    monkeypatch.setattr(js_parser, "_SCRIPT_PATH", str(script))
+    monkeypatch.setattr(js_parser, "_worker", None)
+    monkeypatch.setattr(js_parser, "_worker_stderr", None)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="worker crashed"):
+            js_parser.JSToIR("let x = 1;").parse()
+        assert js_parser._worker is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
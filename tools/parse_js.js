@@ -1,15 +1,48 @@
 // tools/parse_js.js
+// Long-lived parser worker. Each request on stdin is "<byte length>\n<source>";
+// each reply on stdout is one line of JSON: the AST, or {"error": message}.
 const parser = require('@babel/parser');
-const fs = require('fs');
-
-try {
-    const code = fs.readFileSync(0, 'utf8');
-    const ast = parser.parse(code, {
-        sourceType: 'module',
-        plugins: ['jsx', 'classProperties']
-    });
-    console.log(JSON.stringify(ast, null, 2));
-} catch (error) {
-    console.error(JSON.stringify({ error: error.message }));
-    process.exit(1);
-}
\ No newline at end of file
+
+// Positions, comments and raw source text are never read by JSToIR, and are
+// most of the AST's size, so they are left out of the reply.
+const DROPPED_KEYS = new Set([
+    'start', 'end', 'loc', 'range', 'extra', 'comments',
+    'leadingComments', 'trailingComments', 'innerComments'
+]);
+
+function dropUnused(key, value) {
+    return DROPPED_KEYS.has(key) ? undefined : value;
+}
+
+function parse(code) {
+    try {
+        const ast = parser.parse(code, {
+            sourceType: 'module',
+            plugins: ['jsx', 'classProperties'],
+            attachComment: false
+        });
+        return JSON.stringify(ast, dropUnused);
+    } catch (error) {
+        return JSON.stringify({ error: error.message });
+    }
+}
+
+let pending = Buffer.alloc(0);
+
+process.stdin.on('data', (chunk) => {
+    pending = Buffer.concat([pending, chunk]);
+    for (;;) {
+        const newline = pending.indexOf(10);
+        if (newline === -1) {
+            return;
+        }
+        const start = newline + 1;
+        const end = start + parseInt(pending.toString('latin1', 0, newline), 10);
+        if (pending.length < end) {
+            return;
+        }
+        const code = pending.toString('utf8', start, end);
+        pending = pending.subarray(end);
+        process.stdout.write(parse(code) + '\n');
+    }
+});
@@ -1,34 +1,108 @@
 # translators/__init__.py
 """
 Main translation functions
+
+Parsers and generators are imported on first use, so translating between two
+languages never loads the front-end for the third (e.g. javalang).
 """
 
-from .python_parser import parse_python_to_ir
-from .js_parser import parse_js_to_ir
-from .java_parser import parse_java_to_ir
-from .gen_py import generate_py_from_ir
-from .gen_js import generate_js_from_ir
-from .gen_java import generate_java_from_ir
-
-
-def translate_snippet(source_code: str, from_lang: str, to_lang: str) -> str:
-    """Translate code snippet from one language to another"""
-    # Parse source to IR
-    if from_lang == "py":
-        ir = parse_python_to_ir(source_code)
-    elif from_lang == "js":
-        ir = parse_js_to_ir(source_code)
-    elif from_lang == "java":
-        ir = parse_java_to_ir(source_code)
-    else:
-        raise ValueError(f"Unsupported source language: {from_lang}")
-
-    # Generate target code
-    if to_lang == "py":
-        return generate_py_from_ir(ir)
-    elif to_lang == "js":
-        return generate_js_from_ir(ir)
-    elif to_lang == "java":
-        return generate_java_from_ir(ir)
-    else:
-        raise ValueError(f"Unsupported target language: {to_lang}")
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, Dict, Tuple
+
+from .ir import IRNode, LRUCache, _source_digest
+
+# Language -> (module, function) for each side of a translation
+_PARSERS: Dict[str, Tuple[str, str]] = {
+    "py": (".python_parser", "parse_python_to_ir"),
+    "js": (".js_parser", "parse_js_to_ir"),
+    "java": (".java_parser", "parse_java_to_ir"),
+}
+_GENERATORS: Dict[str, Tuple[str, str]] = {
+    "py": (".gen_py", "generate_py_from_ir"),
+    "js": (".gen_js", "generate_js_from_ir"),
+    "java": (".gen_java", "generate_java_from_ir"),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_parser(lang: str) -> Callable[[str], IRNode]:
+    """Import and return the parse function for a source language"""
+    if lang not in _PARSERS:
+        raise ValueError(f"Unsupported source language: {lang}")
+    module, name = _PARSERS[lang]
+    parser: Callable[[str], IRNode] = getattr(import_module(module, __name__), name)
+    return parser
+
+
+@lru_cache(maxsize=None)
+def _get_generator(lang: str) -> Callable[[IRNode], str]:
+    """Import and return the generate function for a target language"""
+    if lang not in _GENERATORS:
+        raise ValueError(f"Unsupported target language: {lang}")
+    module, name = _GENERATORS[lang]
+    generator: Callable[[IRNode], str] = getattr(import_module(module, __name__), name)
+    return generator
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the parse_*/generate_* re-exports lazily"""
+    for module, func in (*_PARSERS.values(), *_GENERATORS.values()):
+        if func == name:
+            return getattr(import_module(module, __name__), func)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# IR keyed by (source digest, from_lang). Trees here are shared between calls,
+# which is safe because generators only read them; the public parse_*_to_ir
+# functions always build a fresh tree.
+_parse_cache: LRUCache[Tuple[bytes, str], IRNode] = LRUCache(256)
+
+
+def _parse(source_code: str, from_lang: str) -> IRNode:
+    """Parse source to IR, reusing the result for repeated snippets"""
+    key = (_source_digest(source_code), from_lang)
+    ir = _parse_cache.get(key)
+    if ir is None:
+        # Parse errors propagate and are not cached
+        ir = _get_parser(from_lang)(source_code)
+        _parse_cache.put(key, ir)
+    return ir
+
+
+# Generated code keyed by (source digest, from_lang, to_lang)
+_translate_cache: LRUCache[Tuple[bytes, str, str], str] = LRUCache(256)
+
+
+def _translate(source_code: str, from_lang: str, to_lang: str) -> str:
+    """Parse and generate, reusing the output for repeated translations
+
+    IR is a pure function of the source text, so a digest of the source serves
+    as the cache key instead of a structural hash of the IR. Like the parse
+    cache, this never keeps the source itself alive.
+    """
+    key = (_source_digest(source_code), from_lang, to_lang)
+    code = _translate_cache.get(key)
+    if code is None:
+        # Parse source to IR
+        ir = _parse(source_code, from_lang)
+
+        # Generate target code
+        code = _get_generator(to_lang)(ir)
+        _translate_cache.put(key, code)
+    return code
+
+
+def translate_snippet(
+    source_code: str, from_lang: str, to_lang: str, normalize: bool = False
+) -> str:
+    """Translate code snippet from one language to another
+
+    If both languages are the same the source is returned as is, unless
+    normalize is set, in which case it is round-tripped through the IR.
+    """
+    if from_lang == to_lang and not normalize:
+        if from_lang not in _PARSERS:
+            raise ValueError(f"Unsupported source language: {from_lang}")
+        return source_code
+    return _translate(source_code, from_lang, to_lang)
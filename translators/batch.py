@@ -0,0 +1,29 @@
+# translators/batch.py
+"""
+Batch parsing for Code Snippet Translator
+
+Parses many independent sources in parallel, one interpreter per CPU core
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence
+
+from . import _get_parser, _parse
+from .ir import IRNode
+
+
+def parse_many(
+    sources: Sequence[str], lang: str, max_workers: Optional[int] = None
+) -> List[IRNode]:
+    """Parse each source to IR across a process pool, in input order
+
+    max_workers defaults to the number of CPUs. Forked workers drop the
+    parent's Node.js parser and cache locks, so for JS every worker process
+    starts and reuses its own Node.js parser.
+    """
+    _get_parser(lang)  # fail fast on an unsupported language
+    if not sources:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse, sources, repeat(lang)))
@@ -0,0 +1,95 @@
+# translators/gen_base.py
+"""
+Base Code Generator
+
+Shared IR walk for the per-language generators in gen_*.py
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from .ir import IRNode
+
+
+def quote_string(value: str) -> str:
+    """Double-quoted string literal, valid in Python, JavaScript and Java"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+class CodeGenerator:
+    """Walks IR and writes target code; subclasses supply the language
+
+    Subclasses fill two tables. _EMITTERS holds node types with statement
+    bodies, whose emitters write straight to self._out. _DISPATCH holds
+    single-line node types, whose handlers return the generated code.
+    Statement templates sit at module level in each gen_*.py, filled with
+    %-formatting.
+    """
+
+    # Default indent for _emit_block, and the prefix for unsupported nodes
+    _INDENT = "    "
+    _UNSUPPORTED = "# Unsupported: "
+
+    _EMITTERS: Dict[str, Callable[[Any, IRNode], None]] = {}
+    _DISPATCH: Dict[str, Callable[[Any, IRNode], str]] = {}
+
+    def __init__(self, ir: IRNode):
+        self.ir = ir
+        # Output chunks, joined once at the end of generate()
+        self._out: List[str] = []
+
+    def generate(self) -> str:
+        """Generate code from IR"""
+        self._out = []
+        self._emit_node(self.ir)
+        return "".join(self._out)
+
+    def _emit_module(self, module: IRNode) -> None:
+        """Emit module code"""
+        out = self._out
+        for i, node in enumerate(module["body"]):
+            if i:
+                out.append("\n\n")
+            self._emit_node(node)
+
+    def _emit_node(self, node: IRNode) -> None:
+        """Emit code for a single IR node"""
+        emitter = self._EMITTERS.get(node["type"])
+        if emitter is not None:
+            emitter(self, node)
+        else:
+            self._out.append(self._generate_node(node))
+
+    def _emit_block(self, stmts: List[IRNode], indent: Optional[str] = None) -> None:
+        """Emit statements one per line, each prefixed with indent"""
+        if indent is None:
+            indent = self._INDENT
+        out = self._out
+        sep = "\n" + indent
+        for i, stmt in enumerate(stmts):
+            out.append(sep if i else indent)
+            self._emit_node(stmt)
+
+    def _generate_node(self, node: IRNode) -> str:
+        """Generate code for a single IR node"""
+        node_type = node["type"]
+        handler = self._DISPATCH.get(node_type)
+        if handler is not None:
+            return handler(self, node)
+        if node_type in self._EMITTERS:
+            return self._render(node)
+        return self._UNSUPPORTED + str(node_type)
+
+    def _generate_default(self, default: Any) -> str:
+        """Generate a parameter default; older IR holds these as source text"""
+        if isinstance(default, str):
+            return default
+        return self._generate_node(default)
+
+    def _render(self, node: IRNode) -> str:
+        """Emit a block statement into a fresh buffer and return its code"""
+        out, self._out = self._out, []
+        self._emit_node(node)
+        code = "".join(self._out)
+        self._out = out
+        return code
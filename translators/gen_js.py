@@ -5,79 +5,57 @@ JavaScript Code Generator from IR
 Generates JavaScript code from intermediate representation
 """
 
-from typing import cast
+from typing import Any, Callable, Dict
 
+from .gen_base import CodeGenerator, quote_string
 from .ir import IRNode
 
+_FUNC_TPL = "function %s(%s) {\n"
+_IF_TPL = "if (%s) {\n"
+_ELSE = " else {\n"
+_FOR_TPL = "for (let %s = 0; %s < %s; %s++) {\n"
+_WHILE_TPL = "while (%s) {\n"
+_CLASS_TPL = "class %s {\n"
+_BLOCK_CLOSE = "\n}"
 
-class JSGenerator:
+_LITERAL_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: quote_string,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+}
+
+
+class JSGenerator(CodeGenerator):
     """Generates JavaScript code from IR"""
 
+    _INDENT = "  "
+    _UNSUPPORTED = "// Unsupported: "
+
     def __init__(self, ir: IRNode):
-        self.ir = ir
+        super().__init__(ir)
         self.indent_level = 0
 
-    def generate(self) -> str:
-        """Generate JS code from IR"""
-        if self.ir["type"] == "Module":
-            return self._generate_module(self.ir)
-        return self._generate_node(self.ir)
-
-    def _generate_module(self, module: IRNode) -> str:
-        """Generate module code"""
-        code = []
-        for node in module["body"]:
-            code.append(self._generate_node(node))
-        return "\n\n".join(code)
-
-    def _generate_node(self, node: IRNode) -> str:
-        """Generate code for a single IR node"""
-        node_type = cast(str, node["type"])
-
-        if node_type == "Function":
-            return self._generate_function(node)
-        elif node_type == "Return":
-            return self._generate_return(node)
-        elif node_type == "BinaryOp":
-            return self._generate_binary_op(node)
-        elif node_type == "Name":
-            return str(node["id"])
-        elif node_type == "Literal":
-            return self._generate_literal(node)
-        elif node_type == "Assign":
-            return self._generate_assign(node)
-        elif node_type == "If":
-            return self._generate_if(node)
-        elif node_type == "For":
-            return self._generate_for(node)
-        elif node_type == "While":
-            return self._generate_while(node)
-        elif node_type == "Call":
-            return self._generate_call(node)
-        elif node_type == "Class":
-            return self._generate_class(node)
-
-        return "// Unsupported: " + str(node_type)
-
-    def _generate_function(self, node: IRNode) -> str:
-        """Generate function code"""
+    def _emit_function(self, node: IRNode) -> None:
+        """Emit function code"""
         name = node["name"]
         params = []
         for param in node["params"]:
             param_str = param["name"]
-            if param.get("default"):
-                param_str += f" = {param['default']}"
+            default = param.get("default")
+            if default is not None:
+                param_str += " = " + self._generate_default(default)
             params.append(param_str)
 
         params_str = ", ".join(params)
-        body = "\n".join([f"  {self._generate_node(stmt)}" for stmt in node["body"]])
-
-        return f"function {name}({params_str}) {{\n{body}\n}}"
+        self._out.append(_FUNC_TPL % (name, params_str))
+        self._emit_block(node["body"])
+        self._out.append(_BLOCK_CLOSE)
 
     def _generate_return(self, node: IRNode) -> str:
         """Generate return statement"""
-        value = self._generate_node(node["value"]) if node.get("value") else ""
-        return f"return {value};"
+        value = node["value"]
+        code = self._generate_node(value) if value is not None else ""
+        return f"return {code};"
 
     def _generate_binary_op(self, node: IRNode) -> str:
         """Generate binary operation"""
@@ -86,16 +64,15 @@ class JSGenerator:
         op = node["op"]
         return f"{left} {op} {right}"
 
+    def _generate_name(self, node: IRNode) -> str:
+        """Generate identifier"""
+        return str(node["id"])
+
     def _generate_literal(self, node: IRNode) -> str:
         """Generate literal value"""
         value = node["value"]
-        if isinstance(value, str):
-            return f'"{value}"'
-        elif value is None:
-            return "null"
-        elif isinstance(value, bool):
-            return "true" if value else "false"
-        return str(value)
+        formatter = _LITERAL_FORMATTERS.get(type(value))
+        return formatter(value) if formatter is not None else str(value)
 
     def _generate_assign(self, node: IRNode) -> str:
         """Generate assignment"""
@@ -103,32 +80,32 @@ class JSGenerator:
         value = self._generate_node(node["value"])
         return f"{target} = {value};"
 
-    def _generate_if(self, node: IRNode) -> str:
-        """Generate if statement"""
+    def _emit_if(self, node: IRNode) -> None:
+        """Emit if statement"""
         test = self._generate_node(node["test"])
-        body = "\n".join([f"  {self._generate_node(stmt)}" for stmt in node["body"]])
-        code = f"if ({test}) {{\n{body}\n}}"
+        self._out.append(_IF_TPL % test)
+        self._emit_block(node["body"])
+        self._out.append(_BLOCK_CLOSE)
 
-        if node.get("orelse"):
-            orelse_body = "\n".join(
-                [f"  {self._generate_node(stmt)}" for stmt in node["orelse"]]
-            )
-            code += f" else {{\n{orelse_body}\n}}"
+        if node["orelse"]:
+            self._out.append(_ELSE)
+            self._emit_block(node["orelse"])
+            self._out.append(_BLOCK_CLOSE)
 
-        return code
-
-    def _generate_for(self, node: IRNode) -> str:
-        """Generate for loop (simplified)"""
+    def _emit_for(self, node: IRNode) -> None:
+        """Emit for loop (simplified)"""
         target = self._generate_node(node["target"])
         iter = self._generate_node(node["iter"])
-        body = "\n".join([f"  {self._generate_node(stmt)}" for stmt in node["body"]])
-        return f"for (let {target} = 0; {target} < {iter}; {target}++) {{\n{body}\n}}"
+        self._out.append(_FOR_TPL % (target, target, iter, target))
+        self._emit_block(node["body"])
+        self._out.append(_BLOCK_CLOSE)
 
-    def _generate_while(self, node: IRNode) -> str:
-        """Generate while loop"""
+    def _emit_while(self, node: IRNode) -> None:
+        """Emit while loop"""
         test = self._generate_node(node["test"])
-        body = "\n".join([f"  {self._generate_node(stmt)}" for stmt in node["body"]])
-        return f"while ({test}) {{\n{body}\n}}"
+        self._out.append(_WHILE_TPL % test)
+        self._emit_block(node["body"])
+        self._out.append(_BLOCK_CLOSE)
 
     def _generate_call(self, node: IRNode) -> str:
         """Generate function call"""
@@ -137,13 +114,29 @@ class JSGenerator:
         args_str = ", ".join(args)
         return f"{func}({args_str})"
 
-    def _generate_class(self, node: IRNode) -> str:
-        """Generate class"""
-        name = node["name"]
-        body = "\n".join(
-            [f"  {self._generate_node(member)}" for member in node["body"]]
-        )
-        return f"class {name} {{\n{body}\n}}"
+    def _emit_class(self, node: IRNode) -> None:
+        """Emit class"""
+        self._out.append(_CLASS_TPL % node["name"])
+        self._emit_block(node["body"])
+        self._out.append(_BLOCK_CLOSE)
+
+    _EMITTERS: Dict[str, Callable[["JSGenerator", IRNode], None]] = {
+        "Module": CodeGenerator._emit_module,
+        "Function": _emit_function,
+        "If": _emit_if,
+        "For": _emit_for,
+        "While": _emit_while,
+        "Class": _emit_class,
+    }
+
+    _DISPATCH: Dict[str, Callable[["JSGenerator", IRNode], str]] = {
+        "Return": _generate_return,
+        "BinaryOp": _generate_binary_op,
+        "Name": _generate_name,
+        "Literal": _generate_literal,
+        "Assign": _generate_assign,
+        "Call": _generate_call,
+    }
 
 
 def generate_js_from_ir(ir: IRNode) -> str:
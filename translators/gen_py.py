@@ -5,78 +5,51 @@ Python Code Generator from IR
 Generates Python code from intermediate representation
 """
 
-from typing import cast
+from typing import Any, Callable, Dict
 
+from .gen_base import CodeGenerator, quote_string
 from .ir import IRNode
 
+_FUNC_TPL = "def %s(%s):\n"
+_IF_TPL = "if %s:\n"
+_ELSE = "\nelse:\n"
+_FOR_TPL = "for %s in range(%s):\n"
+_WHILE_TPL = "while %s:\n"
+_CLASS_TPL = "class %s:\n"
 
-class PyGenerator:
+_LITERAL_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: quote_string,
+    bool: lambda v: "True" if v else "False",
+    type(None): lambda v: "None",
+}
+
+
+class PyGenerator(CodeGenerator):
     """Generates Python code from IR"""
 
-    def __init__(self, ir: IRNode):
-        self.ir = ir
-
-    def generate(self) -> str:
-        """Generate Python code from IR"""
-        if self.ir["type"] == "Module":
-            return self._generate_module(self.ir)
-        return self._generate_node(self.ir)
-
-    def _generate_module(self, module: IRNode) -> str:
-        """Generate module code"""
-        code = []
-        for node in module["body"]:
-            code.append(self._generate_node(node))
-        return "\n\n".join(code)
-
-    def _generate_node(self, node: IRNode) -> str:
-        """Generate code for a single IR node"""
-        node_type = cast(str, node["type"])
-
-        if node_type == "Function":
-            return self._generate_function(node)
-        elif node_type == "Return":
-            return self._generate_return(node)
-        elif node_type == "BinaryOp":
-            return self._generate_binary_op(node)
-        elif node_type == "Name":
-            return str(node["id"])
-        elif node_type == "Literal":
-            return self._generate_literal(node)
-        elif node_type == "Assign":
-            return self._generate_assign(node)
-        elif node_type == "If":
-            return self._generate_if(node)
-        elif node_type == "For":
-            return self._generate_for(node)
-        elif node_type == "While":
-            return self._generate_while(node)
-        elif node_type == "Call":
-            return self._generate_call(node)
-        elif node_type == "Class":
-            return self._generate_class(node)
-
-        return "# Unsupported: " + str(node_type)
-
-    def _generate_function(self, node: IRNode) -> str:
-        """Generate function code"""
+    _INDENT = "    "
+    _UNSUPPORTED = "# Unsupported: "
+
+    def _emit_function(self, node: IRNode) -> None:
+        """Emit function code"""
         name = node["name"]
         params = []
         for param in node["params"]:
             param_str = param["name"]
-            if param.get("default"):
-                param_str += f"={param['default']}"
+            default = param.get("default")
+            if default is not None:
+                param_str += "=" + self._generate_default(default)
             params.append(param_str)
 
         params_str = ", ".join(params)
-        body = "\n".join([f"    {self._generate_node(stmt)}" for stmt in node["body"]])
-
-        return f"def {name}({params_str}):\n{body}"
+        self._out.append(_FUNC_TPL % (name, params_str))
+        self._emit_block(node["body"])
 
     def _generate_return(self, node: IRNode) -> str:
         """Generate return statement"""
-        value = self._generate_node(node["value"]) if node.get("value") else ""
-        return f"return {value}"
+        value = node["value"]
+        code = self._generate_node(value) if value is not None else ""
+        return f"return {code}"
 
     def _generate_binary_op(self, node: IRNode) -> str:
         """Generate binary operation"""
@@ -85,16 +58,15 @@ class PyGenerator:
         op = node["op"]
         return f"{left} {op} {right}"
 
+    def _generate_name(self, node: IRNode) -> str:
+        """Generate identifier"""
+        return str(node["id"])
+
     def _generate_literal(self, node: IRNode) -> str:
         """Generate literal value"""
         value = node["value"]
-        if isinstance(value, str):
-            return f'"{value}"'
-        elif value is None:
-            return "None"
-        elif isinstance(value, bool):
-            return "True" if value else "False"
-        return str(value)
+        formatter = _LITERAL_FORMATTERS.get(type(value))
+        return formatter(value) if formatter is not None else str(value)
 
     def _generate_assign(self, node: IRNode) -> str:
         """Generate assignment"""
@@ -102,32 +74,28 @@ class PyGenerator:
         value = self._generate_node(node["value"])
         return f"{target} = {value}"
 
-    def _generate_if(self, node: IRNode) -> str:
-        """Generate if statement"""
+    def _emit_if(self, node: IRNode) -> None:
+        """Emit if statement"""
         test = self._generate_node(node["test"])
-        body = "\n".join([f"    {self._generate_node(stmt)}" for stmt in node["body"]])
-        code = f"if {test}:\n{body}"
+        self._out.append(_IF_TPL % test)
+        self._emit_block(node["body"])
 
-        if node.get("orelse"):
-            orelse_body = "\n".join(
-                [f"    {self._generate_node(stmt)}" for stmt in node["orelse"]]
-            )
-            code += f"\nelse:\n{orelse_body}"
+        if node["orelse"]:
+            self._out.append(_ELSE)
+            self._emit_block(node["orelse"])
 
-        return code
-
-    def _generate_for(self, node: IRNode) -> str:
-        """Generate for loop (simplified)"""
+    def _emit_for(self, node: IRNode) -> None:
+        """Emit for loop (simplified)"""
         target = self._generate_node(node["target"])
         iter = self._generate_node(node["iter"])
-        body = "\n".join([f"    {self._generate_node(stmt)}" for stmt in node["body"]])
-        return f"for {target} in range({iter}):\n{body}"
+        self._out.append(_FOR_TPL % (target, iter))
+        self._emit_block(node["body"])
 
-    def _generate_while(self, node: IRNode) -> str:
-        """Generate while loop"""
+    def _emit_while(self, node: IRNode) -> None:
+        """Emit while loop"""
         test = self._generate_node(node["test"])
-        body = "\n".join([f"    {self._generate_node(stmt)}" for stmt in node["body"]])
-        return f"while {test}:\n{body}"
+        self._out.append(_WHILE_TPL % test)
+        self._emit_block(node["body"])
 
     def _generate_call(self, node: IRNode) -> str:
         """Generate function call"""
@@ -136,13 +104,28 @@ class PyGenerator:
         args_str = ", ".join(args)
         return f"{func}({args_str})"
 
-    def _generate_class(self, node: IRNode) -> str:
-        """Generate class"""
-        name = node["name"]
-        body = "\n".join(
-            [f"    {self._generate_node(member)}" for member in node["body"]]
-        )
-        return f"class {name}:\n{body}"
+    def _emit_class(self, node: IRNode) -> None:
+        """Emit class"""
+        self._out.append(_CLASS_TPL % node["name"])
+        self._emit_block(node["body"])
+
+    _EMITTERS: Dict[str, Callable[["PyGenerator", IRNode], None]] = {
+        "Module": CodeGenerator._emit_module,
+        "Function": _emit_function,
+        "If": _emit_if,
+        "For": _emit_for,
+        "While": _emit_while,
+        "Class": _emit_class,
+    }
+
+    _DISPATCH: Dict[str, Callable[["PyGenerator", IRNode], str]] = {
+        "Return": _generate_return,
+        "BinaryOp": _generate_binary_op,
+        "Name": _generate_name,
+        "Literal": _generate_literal,
+        "Assign": _generate_assign,
+        "Call": _generate_call,
+    }
 
 
 def generate_py_from_ir(ir: IRNode) -> str:
@@ -4,14 +4,75 @@ Intermediate Representation (IR) for Code Snippet Translator
 
 This module defines the structure for the language-agnostic IR used to represent
 code snippets before translation to target languages.
+
+IR nodes are treated as immutable once built: generators only read them, and
+IRBuilder hands out shared, read-only nodes for common literals.
 """
 
+import hashlib
 import json
-from typing import Any, Dict, List, Optional, Union
+import math
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional speedup, see the "fast" extra
+    _HAS_ORJSON = False
 
 # IR Node Types
 IRNode = Dict[str, Any]
 
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class _FrozenNode(Dict[str, Any]):
+    """IR node shared by every tree in the process, so it refuses changes"""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("shared IR nodes are read-only")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __reduce__(self) -> Any:
+        # Copies and unpickled nodes are ordinary dicts owned by their tree
+        return (dict, (dict(self),))
+
+
+def _shared_literal(value: Any) -> IRNode:
+    return _FrozenNode(type="Literal", value=value)
+
+
+# Shared nodes for literals that recur in almost every snippet
+_LIT_NONE = _shared_literal(None)
+_LIT_TRUE = _shared_literal(True)
+_LIT_FALSE = _shared_literal(False)
+_LIT_EMPTY_STR = _shared_literal("")
+_SMALL_INT_LITS: Dict[int, IRNode] = {i: _shared_literal(i) for i in range(-5, 257)}
+
+# Operators IRBuilder.binary_op evaluates when both operands are numeric literals
+_FOLDABLE_OPS = frozenset({"+", "-", "*", "/", "%"})
+# Folded ints must still fit a Java int (and stay exact as a JS number)
+_INT_MIN, _INT_MAX = -(2**31), 2**31 - 1
+
 
 class IRBuilder:
     """Helper class to build IR nodes"""
@@ -25,7 +86,7 @@ class IRBuilder:
         return {"type": "Function", "name": name, "params": params, "body": body}
 
     @staticmethod
-    def param(name: str, default: Optional[str] = None) -> Dict[str, Any]:
+    def param(name: str, default: Optional[IRNode] = None) -> Dict[str, Any]:
         return {"name": name, "default": default}
 
     @staticmethod
@@ -34,14 +95,31 @@ class IRBuilder:
 
     @staticmethod
     def binary_op(op: str, left: IRNode, right: IRNode) -> IRNode:
+        if op in _FOLDABLE_OPS:
+            folded = _fold_constants(op, left, right)
+            if folded is not None:
+                return folded
+        # Operators and identifiers are interned so repeats share one object
+        op = sys.intern(op)
         return {"type": "BinaryOp", "op": op, "left": left, "right": right}
 
     @staticmethod
     def name(id: str) -> IRNode:
-        return {"type": "Name", "id": id}
+        return {"type": "Name", "id": sys.intern(id)}
 
     @staticmethod
     def literal(value: Union[str, int, float, bool, None]) -> IRNode:
+        if value is None:
+            return _LIT_NONE
+        if value is True:
+            return _LIT_TRUE
+        if value is False:
+            return _LIT_FALSE
+        # Exact type checks: bools and floats compare equal to ints
+        if type(value) is int and -5 <= value <= 256:
+            return _SMALL_INT_LITS[value]
+        if value == "":
+            return _LIT_EMPTY_STR
         return {"type": "Literal", "value": value}
 
     @staticmethod
@@ -50,9 +128,12 @@ class IRBuilder:
 
     @staticmethod
     def if_stmt(
-        test: IRNode, body: List[IRNode], orelse: List[IRNode] = None
+        test: IRNode, body: List[IRNode], orelse: Optional[List[IRNode]] = None
     ) -> IRNode:
-        return {"type": "If", "test": test, "body": body, "orelse": orelse or []}
+        # Parsers pass their own (possibly empty) list; only build one if omitted
+        if orelse is None:
+            orelse = []
+        return {"type": "If", "test": test, "body": body, "orelse": orelse}
 
     @staticmethod
     def for_stmt(target: IRNode, iter: IRNode, body: List[IRNode]) -> IRNode:
@@ -71,11 +152,128 @@ class IRBuilder:
         return {"type": "Class", "name": name, "body": body}
 
 
+def _fold_constants(op: str, left: IRNode, right: IRNode) -> Optional[IRNode]:
+    """Evaluate op on two numeric literals if every target language agrees"""
+    if not left or not right:
+        return None
+    if left["type"] != "Literal" or right["type"] != "Literal":
+        return None
+    a, b = left["value"], right["value"]
+    # Exact type checks keep bools out
+    if type(a) not in (int, float) or type(b) not in (int, float):
+        return None
+
+    if op == "+":
+        result = a + b
+    elif op == "-":
+        result = a - b
+    elif op == "*":
+        result = a * b
+    elif op == "/":
+        # Int division truncates in Java, so only fold float / float
+        if type(a) is not float or type(b) is not float or b == 0:
+            return None
+        result = a / b
+    else:
+        # Python's % takes the divisor's sign, JS/Java take the dividend's
+        if a < 0 or b <= 0:
+            return None
+        result = a % b
+
+    if type(result) is int:
+        if not _INT_MIN <= result <= _INT_MAX:
+            return None
+    elif not math.isfinite(result):
+        return None
+    return IRBuilder.literal(result)
+
+
+# Every LRUCache, so a forked child can replace locks held by parent threads
+_LRU_CACHES: "weakref.WeakSet[LRUCache[Any, Any]]" = weakref.WeakSet()
+
+
+def _reset_cache_locks_in_child() -> None:
+    for cache in _LRU_CACHES:
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_cache_locks_in_child)
+
+
+def _source_digest(source_code: str) -> bytes:
+    """Cache key for a source text that does not keep the text itself alive"""
+    return hashlib.blake2b(source_code.encode(), digest_size=16).digest()
+
+
+class LRUCache(Generic[_K, _V]):
+    """Small thread-safe LRU mapping; get() returns None on a miss"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[_K, _V]" = OrderedDict()
+        self._lock = threading.Lock()
+        _LRU_CACHES.add(self)
+
+    def get(self, key: _K) -> Optional[_V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check for inf/nan floats, which orjson would write as null"""
+    if type(value) is float:
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed, else json
+
+    Only json accepts Infinity/NaN, so documents orjson rejects are retried
+    with it. orjson reads ints wider than 64 bits as floats; callers whose
+    data may hold such ints should use json directly.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def serialize_ir(ir: IRNode) -> str:
     """Serialize IR to JSON string"""
+    if _HAS_ORJSON and not _has_non_finite(ir):
+        try:
+            return orjson.dumps(ir, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits, which only json handles
     return json.dumps(ir, indent=2)
 
 
 def deserialize_ir(json_str: str) -> IRNode:
-    """Deserialize JSON string to IR"""
-    return json.loads(json_str)  # type: ignore
+    """Deserialize JSON string to IR
+
+    Always json: orjson would read ints wider than 64 bits back as floats, and
+    ruling those out first costs more than json's own parse.
+    """
+    ir: IRNode = json.loads(json_str)
+    return ir
@@ -5,12 +5,15 @@ Java Parser for Code Snippet Translator
 Uses javalang to parse Java code and convert to IR
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import javalang
 
 from .ir import IRBuilder, IRNode
 
+# Fallback for constructs that do not convert; IRBuilder shares this node
+_NONE_LITERAL = IRBuilder.literal(None)
+
 
 class JavaToIR:
     """Converts Java code to IR using javalang"""
@@ -45,28 +48,31 @@ class JavaToIR:
                 if ir_member:
                     body.append(ir_member)
             return IRBuilder.class_def(node.name, body)
-        return IRBuilder.literal(None)  # fallback for unsupported types
+        return _NONE_LITERAL  # fallback for unsupported types
 
     def _convert_member(self, node) -> Optional[IRNode]:
         """Convert class member to IR"""
-        if isinstance(node, javalang.tree.MethodDeclaration):
-            params = [IRBuilder.param(p.name) for p in node.parameters]
-            body = self._convert_block(node.body) if node.body else []
-            return IRBuilder.function(node.name, params, body)
-        elif isinstance(node, javalang.tree.FieldDeclaration):
-            # Simplified field handling
-            if node.declarators:
-                decl = node.declarators[0]
-                init_expr = (
-                    self._convert_expression(decl.initializer)
-                    if decl.initializer
-                    else None
-                )
-                return IRBuilder.assign(
-                    IRBuilder.name(decl.name),
-                    init_expr if init_expr is not None else IRBuilder.literal(None),
-                )
-        return None
+        handler = self._MEMBER_DISPATCH.get(type(node))
+        return handler(self, node) if handler is not None else None
+
+    def _convert_method(self, node) -> IRNode:
+        """Convert method declaration to IR"""
+        params = [IRBuilder.param(p.name) for p in node.parameters]
+        body = self._convert_block(node.body) if node.body else []
+        return IRBuilder.function(node.name, params, body)
+
+    def _convert_field(self, node) -> Optional[IRNode]:
+        """Convert field declaration to IR"""
+        # Simplified field handling
+        if not node.declarators:
+            return None
+        decl = node.declarators[0]
+        init_expr = (
+            self._convert_expression(decl.initializer)
+            if decl.initializer
+            else _NONE_LITERAL
+        )
+        return IRBuilder.assign(IRBuilder.name(decl.name), init_expr)
 
     def _convert_block(self, block) -> List[IRNode]:
         """Convert block statement to IR nodes"""
@@ -81,68 +87,98 @@ class JavaToIR:
 
     def _convert_statement(self, node) -> Optional[IRNode]:
         """Convert statement to IR"""
-        if isinstance(node, javalang.tree.ReturnStatement):
-            value = (
-                self._convert_expression(node.expression) if node.expression else None
-            )
-            return IRBuilder.return_stmt(value)
-        elif isinstance(node, javalang.tree.IfStatement):
-            test = self._convert_expression(node.condition)
-            if test is None:
-                test = IRBuilder.literal(True)  # fallback
-            body = self._convert_block(node.then_statement)
-            orelse = (
-                self._convert_block(node.else_statement) if node.else_statement else []
-            )
-            return IRBuilder.if_stmt(test, body, orelse)
-        elif isinstance(node, javalang.tree.ForStatement):
-            # Simplified
-            target = IRBuilder.name("i")  # placeholder
-            iter_expr = (
-                self._convert_expression(node.condition) if node.condition else None
-            )
-            iter = iter_expr if iter_expr is not None else IRBuilder.literal(10)
-            body = self._convert_block(node.body)
-            return IRBuilder.for_stmt(target, iter, body)
-        elif isinstance(node, javalang.tree.WhileStatement):
-            test = self._convert_expression(node.condition)
-            if test is None:
-                test = IRBuilder.literal(True)  # fallback
-            body = self._convert_block(node.body)
-            return IRBuilder.while_stmt(test, body)
-        elif isinstance(node, javalang.tree.StatementExpression):
-            expr = self._convert_expression(node.expression)
-            return expr if expr is not None else IRBuilder.literal(None)
-        return None
-
-    def _convert_expression(self, node) -> Optional[IRNode]:
+        handler = self._STMT_DISPATCH.get(type(node))
+        return handler(self, node) if handler is not None else None
+
+    def _convert_return(self, node) -> IRNode:
+        """Convert return statement to IR"""
+        value = self._convert_expression(node.expression) if node.expression else None
+        return IRBuilder.return_stmt(value)
+
+    def _convert_if(self, node) -> IRNode:
+        """Convert if statement to IR"""
+        test = self._convert_expression(node.condition)
+        body = self._convert_block(node.then_statement)
+        orelse = self._convert_block(node.else_statement) if node.else_statement else []
+        return IRBuilder.if_stmt(test, body, orelse)
+
+    def _convert_for(self, node) -> IRNode:
+        """Convert for loop to IR"""
+        # Simplified
+        target = IRBuilder.name("i")  # placeholder
+        iter = (
+            self._convert_expression(node.condition)
+            if node.condition
+            else IRBuilder.literal(10)
+        )
+        body = self._convert_block(node.body)
+        return IRBuilder.for_stmt(target, iter, body)
+
+    def _convert_while(self, node) -> IRNode:
+        """Convert while loop to IR"""
+        test = self._convert_expression(node.condition)
+        body = self._convert_block(node.body)
+        return IRBuilder.while_stmt(test, body)
+
+    def _convert_statement_expression(self, node) -> IRNode:
+        """Convert expression statement to IR"""
+        return self._convert_expression(node.expression)
+
+    def _convert_expression(self, node) -> IRNode:
         """Convert expression to IR"""
-        if isinstance(node, javalang.tree.BinaryOperation):
-            left = self._convert_expression(node.operandl)
-            right = self._convert_expression(node.operandr)
-            if left is None or right is None:
-                return IRBuilder.literal(None)  # fallback
-            op = node.operator
-            return IRBuilder.binary_op(op, left, right)
-        elif isinstance(node, javalang.tree.Literal):
-            return IRBuilder.literal(node.value)
-        elif isinstance(node, javalang.tree.MemberReference):
-            return IRBuilder.name(node.member)
-        elif isinstance(node, javalang.tree.MethodInvocation):
-            func = IRBuilder.name(node.member)
-            args = [
-                arg
-                for arg in [self._convert_expression(arg) for arg in node.arguments]
-                if arg is not None
-            ]
-            return IRBuilder.call(func, args)
-        elif isinstance(node, javalang.tree.Assignment):
-            target = self._convert_expression(node.expressionl)
-            value = self._convert_expression(node.value)
-            if target is None or value is None:
-                return IRBuilder.literal(None)  # fallback
-            return IRBuilder.assign(target, value)
-        return IRBuilder.literal(str(node))  # fallback
+        handler = self._EXPR_DISPATCH.get(type(node))
+        if handler is None:
+            return _NONE_LITERAL  # fallback
+        return handler(self, node)
+
+    def _convert_binary_op(self, node) -> IRNode:
+        """Convert binary operation to IR"""
+        left = self._convert_expression(node.operandl)
+        right = self._convert_expression(node.operandr)
+        op = node.operator
+        return IRBuilder.binary_op(op, left, right)
+
+    def _convert_literal(self, node) -> IRNode:
+        """Convert literal to IR"""
+        return IRBuilder.literal(node.value)
+
+    def _convert_member_reference(self, node) -> IRNode:
+        """Convert member reference to IR"""
+        return IRBuilder.name(node.member)
+
+    def _convert_method_invocation(self, node) -> IRNode:
+        """Convert method invocation to IR"""
+        func = IRBuilder.name(node.member)
+        args = [self._convert_expression(arg) for arg in node.arguments]
+        return IRBuilder.call(func, args)
+
+    def _convert_assignment(self, node) -> IRNode:
+        """Convert assignment to IR"""
+        target = self._convert_expression(node.expressionl)
+        value = self._convert_expression(node.value)
+        return IRBuilder.assign(target, value)
+
+    # javalang node class -> converter, matched on the exact type. Subclasses
+    # that should convert like their base need their own entry.
+    _MEMBER_DISPATCH: Dict[type, Callable[["JavaToIR", Any], Optional[IRNode]]] = {
+        javalang.tree.MethodDeclaration: _convert_method,
+        javalang.tree.FieldDeclaration: _convert_field,
+        javalang.tree.ConstantDeclaration: _convert_field,
+    }
+    _STMT_DISPATCH: Dict[type, Callable[["JavaToIR", Any], Optional[IRNode]]] = {
+        javalang.tree.ReturnStatement: _convert_return,
+        javalang.tree.IfStatement: _convert_if,
+        javalang.tree.ForStatement: _convert_for,
+        javalang.tree.WhileStatement: _convert_while,
+        javalang.tree.StatementExpression: _convert_statement_expression,
+    }
+    _EXPR_DISPATCH: Dict[type, Callable[["JavaToIR", Any], IRNode]] = {
+        javalang.tree.BinaryOperation: _convert_binary_op,
+        javalang.tree.Literal: _convert_literal,
+        javalang.tree.MemberReference: _convert_member_reference,
+        javalang.tree.MethodInvocation: _convert_method_invocation,
+        javalang.tree.Assignment: _convert_assignment,
+    }
 
 
 def parse_java_to_ir(source_code: str) -> IRNode:
@@ -5,19 +5,98 @@ JavaScript Parser for Code Snippet Translator
 Uses Node.js helper to parse JS and convert Babel AST to IR
 """
 
-import json
 import os
 import subprocess
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, List, Optional
 
-from .ir import IRBuilder, IRNode
+from .ir import IRBuilder, IRNode, _json_loads
+
+_SCRIPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools", "parse_js.js"
+)
+
+# Fallback for constructs that do not convert; IRBuilder shares this node
+_NONE_LITERAL = IRBuilder.literal(None)
+# Parameter default that does not convert; kept visible in the output rather
+# than silently becoming null
+_UNSUPPORTED_DEFAULT = IRBuilder.name("undefined")
+
+# One Node.js process serves every parse, so startup is paid once per process.
+# Its stderr goes to a temp file: a pipe nobody reads could fill up and block it.
+_worker: Optional["subprocess.Popen[bytes]"] = None
+_worker_stderr: Optional[IO[bytes]] = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker() -> "subprocess.Popen[bytes]":
+    """Return the shared Node.js parser process, (re)starting it if needed
+
+    Must be called with _worker_lock held.
+    """
+    global _worker, _worker_stderr
+    if _worker is None or _worker.poll() is not None:
+        if _worker_stderr is not None:
+            _worker_stderr.close()
+        _worker_stderr = tempfile.TemporaryFile()
+        _worker = subprocess.Popen(
+            ["node", _SCRIPT_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=_worker_stderr,
+        )
+    return _worker
+
+
+def _reset_worker_in_child() -> None:
+    """Forget the parent's worker in a forked child, which starts its own"""
+    global _worker, _worker_stderr, _worker_lock
+    _worker = None
+    _worker_stderr = None
+    # Another parent thread may have held the lock at fork time
+    _worker_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_worker_in_child)
+
+
+def _reap_worker(worker: "subprocess.Popen[bytes]") -> str:
+    """Wait for a worker that stopped replying and return what it logged
+
+    The shared worker is dropped, so the next parse starts a fresh one. Must be
+    called with _worker_lock held.
+    """
+    global _worker, _worker_stderr
+    try:
+        worker.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        worker.kill()
+        worker.wait()
+
+    log = b""
+    if worker is _worker:
+        _worker = None
+        if _worker_stderr is not None:
+            _worker_stderr.seek(0)
+            log = _worker_stderr.read()
+            _worker_stderr.close()
+            _worker_stderr = None
+    elif worker.stderr is not None:
+        log = worker.stderr.read()
+    message = log.decode("utf-8", "replace").strip()
+    return message or f"Node.js worker exited with code {worker.returncode}"
 
 
 class JSToIR:
     """Converts JavaScript code to IR using Babel parser"""
 
-    def __init__(self, source_code: str):
+    def __init__(
+        self, source_code: str, worker: Optional["subprocess.Popen[bytes]"] = None
+    ):
         self.source_code = source_code
+        self.worker = worker
 
     def parse(self) -> IRNode:
         """Parse JS code and return IR Module"""
@@ -31,21 +110,21 @@ class JSToIR:
     def _get_ast_json(self) -> Dict[str, Any]:
         """Get AST JSON from Node.js parser"""
         try:
-            # Get the absolute path to the tools directory
-            tools_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"
-            )
-            script_path = os.path.join(tools_dir, "parse_js.js")
-
-            result = subprocess.run(
-                ["node", script_path],
-                input=self.source_code,
-                text=True,
-                capture_output=True,
-            )
-            if result.returncode != 0:
-                return {"error": result.stderr}
-            return json.loads(result.stdout)  # type: ignore[no-any-return]
+            source = self.source_code.encode("utf-8")
+            with _worker_lock:
+                worker = self.worker or _get_worker()
+                assert worker.stdin is not None and worker.stdout is not None
+                try:
+                    worker.stdin.write(b"%d\n%s" % (len(source), source))
+                    worker.stdin.flush()
+                    reply = worker.stdout.readline()
+                except BrokenPipeError:
+                    reply = b""
+                if not reply:
+                    # Worker exited, e.g. @babel/parser is not installed
+                    return {"error": _reap_worker(worker)}
+            ast_json: Dict[str, Any] = _json_loads(reply)
+            return ast_json
         except Exception as e:
             return {"error": str(e)}
 
@@ -60,44 +139,61 @@ class JSToIR:
 
     def _convert_node(self, node: Dict[str, Any]) -> Optional[IRNode]:
         """Convert Babel AST node to IR"""
+        handler = self._DISPATCH.get(node.get("type", ""))
+        if handler is None:
+            # Skip unsupported nodes
+            return None
+        return handler(self, node)
+
+    def _convert_identifier(self, node: Dict[str, Any]) -> IRNode:
+        return IRBuilder.name(node["name"])
+
+    def _convert_literal(self, node: Dict[str, Any]) -> IRNode:
+        # NullLiteral has no value
+        return IRBuilder.literal(node.get("value"))
+
+    def _convert_unary(self, node: Dict[str, Any]) -> Optional[IRNode]:
+        # Only signed numbers; the IR has no unary operators
+        if not _is_signed_number(node):
+            return None
+        value = node["argument"]["value"]
+        return IRBuilder.literal(-value if node["operator"] == "-" else value)
+
+    def _convert_default(self, node: Dict[str, Any]) -> IRNode:
+        """Convert a parameter default, or a placeholder if any part won't convert"""
+        if self._is_convertible(node):
+            default = self._convert_node(node)
+            if default is not None:
+                return default
+        return _UNSUPPORTED_DEFAULT
+
+    def _is_convertible(self, node: Dict[str, Any]) -> bool:
+        """Check that every node in a Babel expression has a converter"""
         node_type = node.get("type")
+        if node_type == "UnaryExpression":
+            return _is_signed_number(node)
+        if node_type not in self._DISPATCH:
+            return False
+        for value in node.values():
+            if isinstance(value, dict):
+                if not self._is_convertible(value):
+                    return False
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and not self._is_convertible(item):
+                        return False
+        return True
 
-        if node_type == "FunctionDeclaration":
-            return self._convert_function(node)
-        elif node_type == "ReturnStatement":
-            return self._convert_return(node)
-        elif node_type == "BinaryExpression":
-            return self._convert_binary_op(node)
-        elif node_type == "Identifier":
-            return IRBuilder.name(node["name"])
-        elif node_type == "Literal":
-            return IRBuilder.literal(node["value"])
-        elif node_type == "NumericLiteral":
-            return IRBuilder.literal(node["value"])
-        elif node_type == "VariableDeclaration":
-            # Simplified: handle first declarator
-            if node.get("declarations"):
-                decl = node["declarations"][0]
-                init_node = (
-                    self._convert_node(decl["init"]) if decl.get("init") else None
-                )
-                return IRBuilder.assign(
-                    IRBuilder.name(decl["id"]["name"]),
-                    init_node if init_node is not None else IRBuilder.literal(None),
-                )
-        elif node_type == "IfStatement":
-            return self._convert_if(node)
-        elif node_type == "ForStatement":
-            return self._convert_for(node)
-        elif node_type == "WhileStatement":
-            return self._convert_while(node)
-        elif node_type == "CallExpression":
-            return self._convert_call(node)
-        elif node_type == "ClassDeclaration":
-            return self._convert_class(node)
-
-        # Skip unsupported nodes
-        return None
+    def _convert_var(self, node: Dict[str, Any]) -> Optional[IRNode]:
+        # Simplified: handle first declarator
+        if not node.get("declarations"):
+            return None
+        decl = node["declarations"][0]
+        init_node = self._convert_node(decl["init"]) if decl.get("init") else None
+        return IRBuilder.assign(
+            IRBuilder.name(decl["id"]["name"]),
+            init_node if init_node is not None else _NONE_LITERAL,
+        )
 
     def _convert_function(self, node: Dict[str, Any]) -> IRNode:
         name = node["id"]["name"] if node.get("id") else "anonymous"
@@ -107,8 +203,8 @@ class JSToIR:
                 params.append(IRBuilder.param(p["name"]))
             elif p["type"] == "AssignmentPattern":
                 param_name = p["left"]["name"]
-                default_str = str(p["right"].get("value", "undefined"))
-                params.append(IRBuilder.param(param_name, default_str))
+                default = self._convert_default(p["right"])
+                params.append(IRBuilder.param(param_name, default))
         body = [
             ir_stmt
             for stmt in node.get("body", {}).get("body", [])
@@ -124,14 +220,14 @@ class JSToIR:
         left = self._convert_node(node["left"])
         right = self._convert_node(node["right"])
         if left is None or right is None:
-            return IRBuilder.literal(None)  # fallback
+            return _NONE_LITERAL  # fallback
         op = node["operator"]
         return IRBuilder.binary_op(op, left, right)
 
     def _convert_if(self, node: Dict[str, Any]) -> IRNode:
         test = self._convert_node(node["test"])
         if test is None:
-            return IRBuilder.literal(None)  # fallback
+            return _NONE_LITERAL  # fallback
         body = [
             ir_stmt
             for stmt in node.get("consequent", {}).get("body", [])
@@ -177,7 +273,7 @@ class JSToIR:
     def _convert_while(self, node: Dict[str, Any]) -> IRNode:
         test = self._convert_node(node["test"])
         if test is None:
-            return IRBuilder.literal(None)  # fallback
+            return _NONE_LITERAL  # fallback
         body = [
             ir_stmt
             for stmt in node.get("body", {}).get("body", [])
@@ -188,7 +284,7 @@ class JSToIR:
     def _convert_call(self, node: Dict[str, Any]) -> IRNode:
         func = self._convert_node(node["callee"])
         if func is None:
-            return IRBuilder.literal(None)  # fallback
+            return _NONE_LITERAL  # fallback
         args = [
             arg
             for arg in [self._convert_node(arg) for arg in node.get("arguments", [])]
@@ -205,6 +301,36 @@ class JSToIR:
         ]
         return IRBuilder.class_def(name, body)
 
+    # Babel node type -> converter
+    _DISPATCH: Dict[str, Callable[["JSToIR", Dict[str, Any]], Optional[IRNode]]] = {
+        "FunctionDeclaration": _convert_function,
+        "ReturnStatement": _convert_return,
+        "BinaryExpression": _convert_binary_op,
+        "Identifier": _convert_identifier,
+        "Literal": _convert_literal,
+        "NumericLiteral": _convert_literal,
+        "StringLiteral": _convert_literal,
+        "BooleanLiteral": _convert_literal,
+        "NullLiteral": _convert_literal,
+        "UnaryExpression": _convert_unary,
+        "VariableDeclaration": _convert_var,
+        "IfStatement": _convert_if,
+        "ForStatement": _convert_for,
+        "WhileStatement": _convert_while,
+        "CallExpression": _convert_call,
+        "ClassDeclaration": _convert_class,
+    }
+
+
+def _is_signed_number(node: Dict[str, Any]) -> bool:
+    """Check for a UnaryExpression such as -1 or +2.5"""
+    argument = node.get("argument") or {}
+    return (
+        node.get("operator") in ("-", "+")
+        and argument.get("type") in ("NumericLiteral", "Literal")
+        and type(argument.get("value")) in (int, float)
+    )
+
 
 def parse_js_to_ir(source_code: str) -> IRNode:
     """Convenience function to parse JS code to IR"""
@@ -6,12 +6,12 @@ Converts Python AST to intermediate representation (IR)
 """
 
 import ast
-from typing import List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from .ir import IRBuilder, IRNode
 
 
-def _unparse_ast_node(node):
+def _unparse_ast_node(node: ast.expr) -> str:
     """Fallback unparse function for Python < 3.9 compatibility"""
     if hasattr(ast, "unparse"):
         return ast.unparse(node)
@@ -19,7 +19,7 @@ def _unparse_ast_node(node):
         # Simple fallback for Python 3.8
         if isinstance(node, ast.Constant):
             if isinstance(node.value, str):
-                return f'"{node.value}"'
+                return repr(node.value)
             elif node.value is None:
                 return "None"
             elif isinstance(node.value, bool):
@@ -33,48 +33,75 @@ def _unparse_ast_node(node):
             return "default_value"
 
 
+# AST operator class -> IR operator
+_OP_MAP: Dict[type, str] = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.Gt: ">",
+    ast.LtE: "<=",
+    ast.GtE: ">=",
+}
+
+
 class PythonToIR(ast.NodeVisitor):
     """Converts Python AST nodes to IR"""
 
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str) -> None:
         self.source_code = source_code
-        self.ir_body: List[IRNode] = []
 
     def parse(self) -> IRNode:
         """Parse source code and return IR Module"""
         tree = ast.parse(self.source_code)
-        self.visit(tree)
-        return IRBuilder.module(self.ir_body)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        return IRBuilder.module(self._visit_body(tree.body))
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node through the class-keyed dispatch table"""
+        handler = self._DISPATCH.get(type(node))
+        if handler is not None:
+            return handler(self, node)
+        return None
+
+    def _visit_body(self, stmts: List[ast.stmt]) -> List[IRNode]:
+        """Convert a statement list, dropping unsupported statements"""
+        return [ir for ir in map(self.visit, stmts) if ir is not None]
+
+    def _visit_expr(self, node: ast.expr) -> IRNode:
+        """Convert an expression, carrying unsupported ones through as source text"""
+        ir: Optional[IRNode] = self.visit(node)
+        if ir is None:
+            return IRBuilder.name(_unparse_ast_node(node))
+        return ir
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> IRNode:
+        args = node.args.args
+        defaults = node.args.defaults
+        # Defaults belong to the last len(defaults) positional arguments
+        first_default = len(args) - len(defaults)
         params = []
-        for arg in node.args.args:
+        for i, arg in enumerate(args):
             default = None
-            if node.args.defaults:
-                # Handle defaults (simplified)
-                idx = len(node.args.args) - len(node.args.defaults)
-                if arg.arg in [a.arg for a in node.args.args[idx:]]:
-                    default_idx = [a.arg for a in node.args.args].index(arg.arg) - idx
-                    if default_idx >= 0 and default_idx < len(node.args.defaults):
-                        default = _unparse_ast_node(node.args.defaults[default_idx])
+            if i >= first_default:
+                default = self._visit_expr(defaults[i - first_default])
             params.append(IRBuilder.param(arg.arg, default))
 
-        body = []
-        for stmt in node.body:
-            ir_stmt = self.visit(stmt)
-            if ir_stmt is not None:
-                body.append(ir_stmt)
-
-        self.ir_body.append(IRBuilder.function(node.name, params, body))
+        body = self._visit_body(node.body)
+        return IRBuilder.function(node.name, params, body)
 
     def visit_Return(self, node: ast.Return) -> IRNode:
-        value = self.visit(node.value) if node.value else None
+        value = self._visit_expr(node.value) if node.value else None
         return IRBuilder.return_stmt(value)
 
-    def visit_BinOp(self, node: ast.BinOp) -> IRNode:
-        left = self.visit(node.left)
-        right = self.visit(node.right)
+    def visit_BinOp(self, node: ast.BinOp) -> Optional[IRNode]:
         op = self._get_op(node.op)
+        if op is None:
+            return None
+        left = self._visit_expr(node.left)
+        right = self._visit_expr(node.right)
         return IRBuilder.binary_op(op, left, right)
 
     def visit_Name(self, node: ast.Name) -> IRNode:
@@ -85,73 +112,68 @@ class PythonToIR(ast.NodeVisitor):
 
     def visit_Assign(self, node: ast.Assign) -> IRNode:
         # Simplified: assume single target
-        target = self.visit(node.targets[0])
-        value = self.visit(node.value)
+        target = self._visit_expr(node.targets[0])
+        value = self._visit_expr(node.value)
         return IRBuilder.assign(target, value)
 
     def visit_If(self, node: ast.If) -> IRNode:
-        test = self.visit(node.test)
-        body = [self.visit(stmt) for stmt in node.body]
-        orelse = [self.visit(stmt) for stmt in node.orelse] if node.orelse else []
+        test = self._visit_expr(node.test)
+        body = self._visit_body(node.body)
+        orelse = self._visit_body(node.orelse) if node.orelse else []
         return IRBuilder.if_stmt(test, body, orelse)
 
     def visit_For(self, node: ast.For) -> IRNode:
-        target = self.visit(node.target)
-        iter = self.visit(node.iter)
-        body = [self.visit(stmt) for stmt in node.body]
+        target = self._visit_expr(node.target)
+        iter = self._visit_expr(node.iter)
+        body = self._visit_body(node.body)
         return IRBuilder.for_stmt(target, iter, body)
 
     def visit_While(self, node: ast.While) -> IRNode:
-        test = self.visit(node.test)
-        body = [self.visit(stmt) for stmt in node.body]
+        test = self._visit_expr(node.test)
+        body = self._visit_body(node.body)
         return IRBuilder.while_stmt(test, body)
 
     def visit_Call(self, node: ast.Call) -> IRNode:
-        func = self.visit(node.func)
-        args = [self.visit(arg) for arg in node.args]
+        func = self._visit_expr(node.func)
+        args = [self._visit_expr(arg) for arg in node.args]
         return IRBuilder.call(func, args)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        body = [self.visit(stmt) for stmt in node.body]
-        self.ir_body.append(IRBuilder.class_def(node.name, body))
-
-    def visit_Module(self, node: ast.Module) -> None:
-        for stmt in node.body:
-            self.visit(stmt)
-
-    def visit_Compare(self, node: ast.Compare) -> IRNode:
-        if len(node.ops) == 1 and len(node.comparators) == 1:
-            left = self.visit(node.left)
-            op = self._get_op(node.ops[0])
-            right = self.visit(node.comparators[0])
-            return IRBuilder.binary_op(op, left, right)
-        # For multiple comparisons, not supported for MVP
-        return IRBuilder.literal(True)  # placeholder
-
-    def visit_Expr(self, node: ast.Expr) -> None:
-        """Handle expression statements (like docstrings) - skip them for MVP"""
-        pass
-
-    def _get_op(self, op: Union[ast.operator, ast.cmpop]) -> str:
-        """Convert AST operator to string"""
-        op_map = {
-            ast.Add: "+",
-            ast.Sub: "-",
-            ast.Mult: "*",
-            ast.Div: "/",
-            ast.Eq: "==",
-            ast.NotEq: "!=",
-            ast.Lt: "<",
-            ast.Gt: ">",
-            ast.LtE: "<=",
-            ast.GtE: ">=",
-        }
-        return op_map.get(type(op), str(op))
-
-    def generic_visit(self, node):
-        """Fallback for unsupported nodes"""
-        # For MVP, skip unsupported constructs
-        pass
+    def visit_ClassDef(self, node: ast.ClassDef) -> IRNode:
+        body = self._visit_body(node.body)
+        return IRBuilder.class_def(node.name, body)
+
+    def visit_Compare(self, node: ast.Compare) -> Optional[IRNode]:
+        ops = node.ops
+        # Chained comparisons are not supported for MVP
+        if len(ops) != 1 or len(node.comparators) != 1:
+            return None
+        op = self._get_op(ops[0])
+        if op is None:
+            return None
+        left = self._visit_expr(node.left)
+        right = self._visit_expr(node.comparators[0])
+        return IRBuilder.binary_op(op, left, right)
+
+    def _get_op(self, op: Union[ast.operator, ast.cmpop]) -> Optional[str]:
+        """Convert AST operator to string, or None if it has no mapping"""
+        return _OP_MAP.get(type(op))
+
+    # AST node class -> visitor; replaces NodeVisitor's "visit_" + name lookup.
+    # Anything missing (expression statements, docstrings, ...) is skipped.
+    _DISPATCH: Dict[type, Callable[["PythonToIR", Any], Any]] = {
+        ast.FunctionDef: visit_FunctionDef,
+        ast.ClassDef: visit_ClassDef,
+        ast.Return: visit_Return,
+        ast.Assign: visit_Assign,
+        ast.If: visit_If,
+        ast.For: visit_For,
+        ast.While: visit_While,
+        ast.BinOp: visit_BinOp,
+        ast.Compare: visit_Compare,
+        ast.Call: visit_Call,
+        ast.Name: visit_Name,
+        ast.Constant: visit_Constant,
+    }
 
 
 def parse_python_to_ir(source_code: str) -> IRNode: